@@ -29,12 +29,23 @@ API_COMMAND_LINE = "comfyui"
 # URL of the API server (warning: do not add the port number to the URL as it will be passed later)
 API_URL = "127.0.0.1"
 
-# Set this to the maximum number of connection attempts to ComfyUI you want
+# Sizes the start-up time limit (see COMFY_START_TIMEOUT); it no longer caps the
+# number of connection attempts, which back off from COMFY_START_MIN_SLEEP
 MAX_COMFY_START_ATTEMPTS = 40
 
-# The waiting time for each reattempt to connect to ComfyUI
+# Longest wait in seconds between two connection attempts to ComfyUI (the backoff cap)
 COMFY_START_ATTEMPTS_SLEEP = 4
 
+# First waiting time between reattempts; it doubles up to COMFY_START_ATTEMPTS_SLEEP
+COMFY_START_MIN_SLEEP = 0.25
+
+# Total time in seconds allowed for ComfyUI to start, kept at the product of the
+# two values above so the overall budget matches the old fixed-sleep loop
+COMFY_START_TIMEOUT = MAX_COMFY_START_ATTEMPTS * COMFY_START_ATTEMPTS_SLEEP
+
+# Timeout in seconds of the TCP probe run before each HTTP check of ComfyUI
+COMFY_PORT_PROBE_TIMEOUT = 0.25
+
 # Unique identifier for this instance of the worker; used in the WebSocket connection
 INSTANCE_IDENTIFIER = APP_NAME + "-" + str(uuid.uuid4())
 
@@ -1,6 +1,8 @@
+import collections
 import json
 import logging
 import os
+import re
 import signal
 import socket
 import subprocess
@@ -9,6 +11,7 @@ import threading
 import time
 import urllib.parse
 import urllib.request
+from typing import Deque, Optional
 
 import requests
 
@@ -26,6 +29,15 @@ from comfyui_remote.utils.common_utils import kill_comfy_instances
 
 logger = logging.getLogger(__name__)
 
+# Words that mark a line of ComfyUI output as an error
+_ERROR_LINE_RE = re.compile("error|failed|exception|traceback", re.IGNORECASE)
+
+# Node classes that write the workflow outputs
+OUTPUT_NODE_CLASSES = frozenset(("SaveImage", "dnFileOut", "dnSaveImage"))
+
+# Number of trailing API output lines kept for error reports
+_CAPTURED_OUTPUT_LINES = 10
+
 
 class ComfyConnector:
     """
@@ -33,12 +45,22 @@ class ComfyConnector:
     """
 
     _instance = None
+    _instance_pid = None
+    _instance_lock = threading.Lock()
     _process = None
 
     def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super(ComfyConnector, cls).__new__(cls)
-        return cls._instance
+        # Skip the lock once the singleton exists in this process
+        instance = cls._instance
+        if instance is not None and cls._instance_pid == os.getpid():
+            return instance
+
+        with cls._instance_lock:
+            # A forked child must not reuse the parent's API process and socket
+            if cls._instance is None or cls._instance_pid != os.getpid():
+                cls._instance = super(ComfyConnector, cls).__new__(cls)
+                cls._instance_pid = os.getpid()
+            return cls._instance
 
     def __init__(
         self,
@@ -63,6 +85,8 @@ class ComfyConnector:
                 f"ws://{config.API_URL}:{self.urlport}/ws?clientId={self.client_id}"
             )
             self.ws = WSProtoWrapper()
+            # Keep-alive HTTP connection shared by the start-up polls and uploads
+            self.session = requests.Session()
             self.current_iteration = current_iteration
             self.total_iterations = total_iterations
             self.progress = progress
@@ -92,15 +116,14 @@ class ComfyConnector:
                 if is_interrupted():  # Dynamically check if interrupted
                     self.interrupt()
 
+            # Build the argument list once; the string form is only for logging
+            cmd_parts = config.API_COMMAND_LINE.split()
+            if self.comfyui_version:
+                cmd_parts.extend(("--version", str(self.comfyui_version)))
+            cmd_parts.extend(("--port", str(self.urlport)))
+            api_command_line = " ".join(cmd_parts)
             if self.comfyui_version:
-                api_command_line = (
-                    config.API_COMMAND_LINE
-                    + f" --version {self.comfyui_version}"
-                    + f" --port {self.urlport}"
-                )
                 logger.info("api_command_line={}".format(api_command_line))
-            else:
-                api_command_line = config.API_COMMAND_LINE + f" --port {self.urlport}"
             if self._process is None or self._process.poll() is not None:
                 logger.info(f"Starting API process with command: {api_command_line}")
                 logger.info(f"Current working directory: {os.getcwd()}")
@@ -109,7 +132,6 @@ class ComfyConnector:
 
                 try:
                     # Handle bash scripts with better error handling
-                    cmd_parts = api_command_line.split()
                     if cmd_parts[0] == "bash" and len(cmd_parts) > 1:
                         script_path = cmd_parts[1]
                         script_args = cmd_parts[2:] if len(cmd_parts) > 2 else []
@@ -141,7 +163,7 @@ class ComfyConnector:
 
                         self._process = subprocess.Popen(
                             full_command,
-                            preexec_fn=os.setsid,
+                            start_new_session=True,
                             stdout=subprocess.PIPE,
                             stderr=subprocess.PIPE,
                             text=True,
@@ -149,8 +171,8 @@ class ComfyConnector:
                         )
                     else:
                         self._process = subprocess.Popen(
-                            api_command_line.split(),
-                            preexec_fn=os.setsid,
+                            cmd_parts,
+                            start_new_session=True,
                             stdout=subprocess.PIPE,
                             stderr=subprocess.PIPE,
                             text=True,
@@ -172,8 +194,14 @@ class ComfyConnector:
                     logger.error(f"Failed to start API process: {e}")
                     raise
 
-                self._captured_stdout = []
-                self._captured_stderr = []
+                # Only the tail is ever reported, so keep a bounded buffer
+                # instead of the whole output of a long-running server
+                self._captured_stdout: Optional[Deque[str]] = collections.deque(
+                    maxlen=_CAPTURED_OUTPUT_LINES
+                )
+                self._captured_stderr: Optional[Deque[str]] = collections.deque(
+                    maxlen=_CAPTURED_OUTPUT_LINES
+                )
 
                 self._stdout_thread = threading.Thread(
                     target=self._stream_output,
@@ -197,15 +225,7 @@ class ComfyConnector:
                 if line:
                     line = line.rstrip("\n\r")
                     # ComfyUI writes normal output to STDERR, so treat both as INFO unless it's clearly an error
-                    if any(
-                        error_indicator in line.lower()
-                        for error_indicator in [
-                            "error",
-                            "failed",
-                            "exception",
-                            "traceback",
-                        ]
-                    ):
+                    if _ERROR_LINE_RE.search(line):
                         logger.error(f"ComfyUI {stream_type}: {line}")
                     else:
                         logger.info(f"ComfyUI {stream_type}: {line}")
@@ -215,9 +235,28 @@ class ComfyConnector:
         finally:
             pipe.close()
 
+    def _format_captured_output(self, report_missing: bool = False) -> str:
+        """Summarise the last lines of captured API output for error messages."""
+        parts = []
+        for label, attr in (
+            ("error output", "_captured_stderr"),
+            ("standard output", "_captured_stdout"),
+        ):
+            captured = getattr(self, attr, None)
+            if captured:
+                parts.append(f" {label.capitalize()}: " + "\n".join(captured))
+            elif report_missing:
+                parts.append(f" No {label} captured.")
+        return "".join(parts)
+
     def wait_for_api_to_start(self, is_interrupted):
-        """Wait for the API server to start up."""
+        """Wait for the API server to start up.
+
+        Polls with an exponential backoff so a fast start is noticed quickly,
+        and gives up once config.COMFY_START_TIMEOUT has elapsed."""
         attempts = 0
+        delay = config.COMFY_START_MIN_SLEEP
+        deadline = time.monotonic() + config.COMFY_START_TIMEOUT
         while not self.is_api_running(is_interrupted):
             if is_interrupted != False:
                 if is_interrupted():
@@ -229,45 +268,36 @@ class ComfyConnector:
                 if exit_code is not None and exit_code != 0:
                     time.sleep(0.5)
 
-                    error_msg = f"API startup script exited with code {exit_code}."
-                    if hasattr(self, "_captured_stderr") and self._captured_stderr:
-                        stderr_output = "\n".join(self._captured_stderr[-10:])
-                        error_msg += f" Error output: {stderr_output}"
-                    else:
-                        error_msg += " No error output captured."
-                    if hasattr(self, "_captured_stdout") and self._captured_stdout:
-                        stdout_output = "\n".join(self._captured_stdout[-10:])
-                        error_msg += f" Standard output: {stdout_output}"
-                    else:
-                        error_msg += " No standard output captured."
+                    error_msg = (
+                        f"API startup script exited with code {exit_code}."
+                        + self._format_captured_output(report_missing=True)
+                    )
 
                     logger.warning(
                         f"Process exited early but continuing to check API availability: {error_msg}"
                     )
 
-                    # Only fail immediately if we've tried for a reasonable number of attempts
+                    # Only fail once the start-up time budget (deadline) is used up
                     # This allows for enroot initialization errors that don't prevent ComfyUI from starting
-                    if attempts >= (config.MAX_COMFY_START_ATTEMPTS):
+                    if time.monotonic() >= deadline:
                         self.kill_api()
                         kill_comfy_instances()
                         raise RuntimeError(
                             f"API startup script failed after process exit and {attempts} attempts. {error_msg}"
                         )
 
-            if attempts >= config.MAX_COMFY_START_ATTEMPTS:
-                error_msg = f"API startup procedure failed after {attempts} attempts."
-                if hasattr(self, "_captured_stderr") and self._captured_stderr:
-                    stderr_output = "\n".join(self._captured_stderr[-10:])
-                    error_msg += f" Error output: {stderr_output}"
-                if hasattr(self, "_captured_stdout") and self._captured_stdout:
-                    stdout_output = "\n".join(self._captured_stdout[-10:])
-                    error_msg += f" Standard output: {stdout_output}"
+            if time.monotonic() >= deadline:
+                error_msg = (
+                    f"API startup procedure failed after {attempts} attempts."
+                    + self._format_captured_output()
+                )
 
                 self.kill_api()
                 kill_comfy_instances()
                 raise RuntimeError(error_msg)
 
-            time.sleep(config.COMFY_START_ATTEMPTS_SLEEP)
+            time.sleep(delay)
+            delay = min(delay * 2, config.COMFY_START_ATTEMPTS_SLEEP)
             attempts += 1
 
         pid_info = f"PID {self._process.pid}" if self._process else "no active process"
@@ -284,7 +314,14 @@ class ComfyConnector:
                     self.interrupt()
 
             logger.info(f"Checking web server is running in {self.server_address}...")
-            response = requests.get(self.server_address)
+            # A plain TCP connect fails fast while ComfyUI is still booting,
+            # so only issue the HTTP request once the port is accepting
+            with socket.create_connection(
+                (config.API_URL, self.urlport),
+                timeout=config.COMFY_PORT_PROBE_TIMEOUT,
+            ):
+                pass
+            response = self.session.get(self.server_address)
             if response.status_code == 200:
                 self.ws.connect(self.ws_address)
                 logger.info(
@@ -328,6 +365,10 @@ class ComfyConnector:
                 except Exception:
                     pass
 
+            if getattr(self, "session", None) is not None:
+                self.session.close()
+                self.session = None
+
             self._process = None
             self.ws = None
             self.urlport = None
@@ -367,12 +408,6 @@ class ComfyConnector:
         )
         return json.loads(urllib.request.urlopen(req).read())
 
-    def get_output_node(self, payload):
-        for key, value in payload.items():
-            if isinstance(value, dict):
-                if value.get("class_type") in {"SaveImage", "dnFileOut", "dnSaveImage"}:
-                    return value.get("class_type")
-
     def generate_images(self, payload, current_iteration, is_interrupted):
         """Generate images using the ComfyUI API with the provided payload."""
         try:
@@ -394,7 +429,9 @@ class ComfyConnector:
                     logger.warning("WebSocket receive timeout, continuing...")
                     continue
 
-                if isinstance(out, str):
+                # Only "executing" messages matter, so skip parsing the
+                # progress/status chatter that makes up most of the stream
+                if isinstance(out, str) and '"executing"' in out:
                     message = json.loads(out)
                     if message["type"] == "executing":
                         data = message["data"]
@@ -454,7 +491,7 @@ class ComfyConnector:
                     data["subfolder"] = subfolder
                 if folder_type:
                     data["type"] = folder_type
-                response = requests.post(url, files=files, data=data)
+                response = self.session.post(url, files=files, data=data)
             return response.json()
         except Exception:
             raise
@@ -464,7 +501,7 @@ class ComfyConnector:
         """Find the node containing the SaveImage class in a prompt."""
         for key, value in json_object.items():
             if isinstance(value, dict):
-                if value.get("class_type") in {"SaveImage", "dnFileOut", "dnSaveImage"}:
+                if value.get("class_type") in OUTPUT_NODE_CLASSES:
                     return f"['{key}']"
                 result = ComfyConnector.find_output_node(value)
                 if result:
@@ -477,34 +514,6 @@ class ComfyConnector:
         with open(path, "r") as file:
             return json.load(file)
 
-    @staticmethod
-    def replace_key_value(
-        json_object, target_key, new_value, class_type_list=None, exclude=True
-    ):
-        """Edit the payload of a prompt by replacing key values based on class type filters."""
-        if isinstance(json_object, dict):
-            class_type = json_object.get("class_type")
-            should_apply_logic = (
-                exclude
-                and (class_type_list is None or class_type not in class_type_list)
-            ) or (
-                not exclude
-                and (class_type_list is not None and class_type in class_type_list)
-            )
-
-            if should_apply_logic and target_key in json_object:
-                json_object[target_key] = new_value
-
-            for value in json_object.values():
-                ComfyConnector.replace_key_value(
-                    value, target_key, new_value, class_type_list, exclude
-                )
-        elif isinstance(json_object, list):
-            for item in json_object:
-                ComfyConnector.replace_key_value(
-                    item, target_key, new_value, class_type_list, exclude
-                )
-
     def interrupt(self):
         """Handle interruption logic."""
         self._is_interrupted.set()
@@ -1,8 +1,9 @@
+import collections
 import logging
 import select
 import socket
 import time
-from typing import Optional
+from typing import Deque, Optional, Tuple
 from urllib.parse import urlparse
 
 from wsproto import WSConnection, ConnectionType
@@ -31,8 +32,29 @@ class WSProtoWrapper:
         self.ws_connection = None
         self.socket = None
         self.connected = False
-        self._received_messages = []
+        self._received_messages: Deque[str] = collections.deque()
         self._connection_established = False
+        self._parsed_url: Optional[Tuple[str, Optional[str], int, str]] = None
+
+    def _parse_url(self, url: str) -> Tuple[Optional[str], int, str]:
+        """Split a WebSocket URL into host, port and request target.
+
+        Reconnects reuse the same URL, so the result for the last URL is kept.
+
+        Args:
+            url: WebSocket URL (ws:// or wss://)
+
+        Returns:
+            Tuple of (host, port, target)
+        """
+        if self._parsed_url is None or self._parsed_url[0] != url:
+            parsed = urlparse(url)
+            port = parsed.port or (443 if parsed.scheme == "wss" else 80)
+            target = parsed.path
+            if parsed.query:
+                target += "?" + parsed.query
+            self._parsed_url = (url, parsed.hostname, port, target)
+        return self._parsed_url[1:]
 
     def connect(self, url: str, timeout: float = 10.0):
         """Connect to WebSocket server using wsproto.
@@ -46,9 +68,7 @@ class WSProtoWrapper:
             TimeoutError: If handshake times out
         """
         try:
-            parsed = urlparse(url)
-            host = parsed.hostname
-            port = parsed.port or (443 if parsed.scheme == "wss" else 80)
+            host, port, target = self._parse_url(url)
 
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(timeout)
@@ -56,10 +76,6 @@ class WSProtoWrapper:
 
             self.ws_connection = WSConnection(ConnectionType.CLIENT)
 
-            target = parsed.path
-            if parsed.query:
-                target += "?" + parsed.query
-
             request = Request(host=host, target=target)
 
             data_to_send = self.ws_connection.send(request)
@@ -141,7 +157,7 @@ class WSProtoWrapper:
             raise ConnectionError("WebSocket not connected")
 
         if self._received_messages:
-            return self._received_messages.pop(0)
+            return self._received_messages.popleft()
 
         original_timeout = self.socket.gettimeout()
         if timeout is not None:
@@ -181,7 +197,7 @@ class WSProtoWrapper:
                         )
 
                 if self._received_messages:
-                    return self._received_messages.pop(0)
+                    return self._received_messages.popleft()
 
         except Exception as e:
             if "timeout" not in str(e).lower():
@@ -232,4 +248,4 @@ class WSProtoWrapper:
                     self.socket = None
                 self.ws_connection = None
                 self._connection_established = False
-                self._received_messages = []
+                self._received_messages.clear()
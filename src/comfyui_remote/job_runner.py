@@ -32,8 +32,9 @@ from comfyui_remote.utils.common_utils import (
 )
 from comfyui_remote.utils.json_utils import (
     load_json_data,
-    search_params,
+    search_params_by_class,
     update_values,
+    has_publisher,
     modify_start_frame,
     json_publish_script,
     modify_dnloader,
@@ -89,10 +90,13 @@ class ExecuteWorkflow(QObject):
         self.float_args = self.load_json_safe(float_args, "float") if float_args else {}
         self.str_args = self.load_json_safe(str_args, "string") if str_args else {}
 
+        params = search_params_by_class(
+            self.json_data, ("dnInteger", "dnFloat", "dnString")
+        )
         self.params = {
-            "int": search_params(self.json_data, "dnInteger"),
-            "float": search_params(self.json_data, "dnFloat"),
-            "str": search_params(self.json_data, "dnString"),
+            "int": params["dnInteger"],
+            "float": params["dnFloat"],
+            "str": params["dnString"],
         }
 
         self.comfy_connector: Optional[ComfyConnector] = None
@@ -118,12 +122,14 @@ class ExecuteWorkflow(QObject):
 
     def modify_json_with_params(self) -> None:
         """Update JSON data with user-provided integer, float, and string arguments."""
-        if self.int_args:
-            self.json_data = update_values(self.json_data, self.int_args)
-        if self.float_args:
-            self.json_data = update_values(self.json_data, self.float_args)
-        if self.str_args:
-            self.json_data = update_values(self.json_data, self.str_args)
+        # Merge in the same order as before so later types still win on a clash,
+        # and index the workflow titles only once
+        merged_args = {
+            **(self.int_args or {}),
+            **(self.float_args or {}),
+            **(self.str_args or {}),
+        }
+        self.json_data = update_values(self.json_data, merged_args)
 
     def run_api(
         self, modified_json, current_iteration, total_iterations, is_interrupted
@@ -221,23 +227,28 @@ class ExecuteWorkflow(QObject):
         self.modify_json_with_params()
         cache_path = self.prepare_input()
 
+        strip_publisher = not publishing_script and has_publisher(self.json_data)
         first_loop = True
+        reset_folder_flag = False
         self.progress += 5
         self.progress_signal.emit(self.progress)
 
         if cache_path:
-            total_files = 0
-            for files in iterate_through_files(self.cache_dirs):
-                total_files += 1
-            total_iterations = int(total_files) * int(self.batch_size)
+            # The GUI passes the batch size as text; it only matters when there
+            # are input files to batch over, so convert it here, once
+            batch_size = int(self.batch_size)
+            # Walk the cache directories once and reuse the result for every batch
+            file_sets = list(iterate_through_files(self.cache_dirs))
+            total_files = len(file_sets)
+            total_iterations = total_files * batch_size
             current_iteration = 0
 
             if total_files == 1:
                 self.progress += 35
                 self.progress_signal.emit(self.progress)
 
-            for batch_num in range(1, int(self.batch_size) + 1):
-                for files in iterate_through_files(self.cache_dirs):
+            for batch_num in range(1, batch_size + 1):
+                for files in file_sets:
                     if is_interrupted:
                         if is_interrupted():
                             self.interrupt()
@@ -252,15 +263,16 @@ class ExecuteWorkflow(QObject):
                     if first_loop:
                         modify_fileout_folder_bool(self.json_data, True)
                         first_loop = False
-                    else:
+                        reset_folder_flag = True
+                    elif reset_folder_flag:
+                        # The flag stays False from here on, so only rewrite it once
                         modify_fileout_folder_bool(self.json_data, False)
+                        reset_folder_flag = False
 
-                    if current_iteration != total_iterations:
-                        if not publishing_script:
-                            json_data_copy = copy.deepcopy(self.json_data)
-                            modified_json = remove_publisher(json_data_copy)
-                        else:
-                            modified_json = self.json_data
+                    # Only pay for the deep copy when there is a publisher to strip
+                    if current_iteration != total_iterations and strip_publisher:
+                        json_data_copy = copy.deepcopy(self.json_data)
+                        modified_json = remove_publisher(json_data_copy)
                     else:
                         modified_json = self.json_data
 
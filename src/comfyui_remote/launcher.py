@@ -5,9 +5,8 @@ from __future__ import absolute_import
 import argparse
 import os
 import sys
+import traceback
 
-from comfyui_remote.job_runner import ExecuteWorkflow
-from .dispatch import dispatch
 from .logging_config import setup_logging
 
 logger = setup_logging(debug=os.environ.get("DEBUG", False))
@@ -101,8 +100,6 @@ def launch_gui():
         mainWindow.show()
         sys.exit(app.exec_())
     except Exception:
-        import traceback
-
         traceback.print_exc()
         return sys.exit(-1)
 
@@ -119,6 +116,10 @@ def main():
     try:
         if hasattr(args, "run") and args.run:
             logger.info("Submitting Job")
+            # Imported here to keep Qt and the API executor out of the
+            # farm dispatch path
+            from .job_runner import ExecuteWorkflow
+
             executor = ExecuteWorkflow(
                 json_file=args.workflow,
                 batch_size=args.batch_size,
@@ -140,13 +141,14 @@ def main():
             logger.error(f"Workflow file not found: {args.workflow}")
             return sys.exit(-1)
 
+        # Imported here so the CARDS/spider stack only loads for farm dispatches
+        from .dispatch import dispatch
+
         dispatch(workflow=args.workflow, on_farm=args.on_farm)
 
     except KeyboardInterrupt:
         return sys.exit(1)
     except Exception:
-        import traceback
-
         traceback.print_exc()
         return sys.exit(-1)
 
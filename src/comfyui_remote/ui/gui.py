@@ -38,6 +38,29 @@ from comfyui_remote.ui.configs import config
 
 logger = logging.getLogger(__name__)
 
+# Node class exposing each parameter type
+PARAM_NODE_CLASSES = (
+    ("int", "dnInteger"),
+    ("float", "dnFloat"),
+    ("str", "dnString"),
+)
+
+# Converters for the values of each exposed parameter type
+PARAM_TYPE_CASTS = {"int": int, "float": float, "str": str}
+
+# Frame range entries that mean "process every input image"
+EMPTY_FRAME_RANGES = frozenset(("", "0", "0-0", "N/A", "n/a"))
+
+# Default rows of the root parameters table: (name, value, tooltip)
+ROOT_PARAMETERS = (
+    ("Batch Size", "1", "The number of times the workflow will run"),
+    (
+        "Frame Range",
+        "N/A",
+        "Needs to match input range - Empty or N/A will run all images inside the input directory",
+    ),
+)
+
 shows = ["LIBRARY"]
 if os.environ["SHOW"] not in shows:
     shows.append(os.environ["SHOW"])
@@ -281,30 +304,22 @@ class comfyRemote_UI(QtWidgets.QMainWindow):
         Returns:
             Dictionary of parameters categorized by type ('int', 'float', 'str').
         """
-        for param_type, search_key in [
-            ("int", "dnInteger"),
-            ("float", "dnFloat"),
-            ("str", "dnString"),
-        ]:
-            param_list = json_utils.search_params(json_data, search_key)
-            for param in param_list:
-                default_val = json_utils.display_json_param(json_data, param)
+        title_to_key = json_utils.build_title_index(json_data)
+        params_by_class = json_utils.search_params_by_class(
+            json_data, (search_key for _, search_key in PARAM_NODE_CLASSES)
+        )
+        for param_type, search_key in PARAM_NODE_CLASSES:
+            for param in params_by_class[search_key]:
+                default_val = json_utils.display_json_param(
+                    json_data, param, title_to_key
+                )
                 self.params[param_type][param] = default_val
 
         return self.params
 
     def fill_rootParameters(self):
         """Populate the root parameters table with default batch size and frame range."""
-        data = [
-            ("Batch Size", "1", "The number of times the workflow will run"),
-            (
-                "Frame Range",
-                "N/A",
-                "Needs to match input range - Empty or N/A will run all images inside the input directory",
-            ),
-        ]
-
-        for row, (property_name, value, tooltip) in enumerate(data):
+        for row, (property_name, value, tooltip) in enumerate(ROOT_PARAMETERS):
             self.model_rootParameters.setItem(
                 row, 0, QtGui.QStandardItem(property_name)
             )
@@ -372,12 +387,9 @@ class comfyRemote_UI(QtWidgets.QMainWindow):
             value = self.model_exposedParameters.index(row, 1).data()
             hidden_data = self.model_exposedParameters.index(row, 2).data()
 
-            if hidden_data == "int":
-                exposedParameters["int"][key] = int(value)
-            elif hidden_data == "float":
-                exposedParameters["float"][key] = float(value)
-            elif hidden_data == "str":
-                exposedParameters["str"][key] = str(value)
+            cast = PARAM_TYPE_CASTS.get(hidden_data)
+            if cast is not None:
+                exposedParameters[hidden_data][key] = cast(value)
 
         int_args = (
             json.dumps(exposedParameters["int"]) if exposedParameters["int"] else None
@@ -416,8 +428,7 @@ class comfyRemote_UI(QtWidgets.QMainWindow):
             Frame range string or None if invalid/empty.
         """
         frame_range = rootParameters["Frame Range"]
-        invalid_values = ["", "0", "0-0", "N/A", "n/a"]
-        if not frame_range or frame_range in invalid_values:
+        if not frame_range or frame_range in EMPTY_FRAME_RANGES:
             frame_range = None
         return frame_range
 
@@ -2,83 +2,62 @@ import logging
 import os
 import re
 import shutil
-from pathlib import Path
+from typing import Optional
 
 ### Cache Utils ###
 
 logger = logging.getLogger(__name__)
 
+# Frame number right before the file extension
+_FRAME_NUMBER_RE = re.compile(r"(\d+)(?=\.\w+$)")
+
+# Image file extensions accepted as workflow inputs
+IMAGE_EXTENSIONS = frozenset(
+    (".exr", ".png", ".jpg", ".jpeg", ".EXR", ".PNG", ".JPG", ".JPEG")
+)
+
 
 def update_cache(cache_dir):
-    if (
-        os.path.isdir(cache_dir) == False
-    ):  # if ADG_Matting cache folder does not exist, create
-        Path(cache_dir).mkdir(parents=True, exist_ok=True)
-
-    if os.listdir(
-        cache_dir
-    ):  # if there are any folders/files inside of ADG_Matting cache folder, clear all
-        for filename in os.listdir(cache_dir):
-            file_path = os.path.join(cache_dir, filename)
-            try:
-                if os.path.isfile(file_path) or os.path.islink(file_path):
-                    os.unlink(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
-            except Exception as e:
-                logger.error("Failed to delete %s. Reason: %s" % (file_path, e))
+    # if ADG_Matting cache folder does not exist, create
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # Clear every folder/file inside it; scandir entries already carry their
+    # type, so no extra stat calls are needed per entry
+    with os.scandir(cache_dir) as it:
+        entries = list(it)
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            elif entry.is_file() or entry.is_symlink():
+                os.unlink(entry.path)
+        except Exception as e:
+            logger.error("Failed to delete %s. Reason: %s" % (entry.path, e))
 
 
 def transfer_imgs_from_path(im_path, temp_dir):
-    imgs = []
-    if os.listdir(im_path):  # if there are any files in the user input folder
-        for i in os.listdir(im_path):
-            file_name, file_extension = os.path.splitext(i)
-            if file_extension in {
-                ".exr",
-                ".png",
-                ".jpg",
-                ".jpeg",
-                ".EXR",
-                ".PNG",
-                ".JPG",
-                ".JPEG",
-            }:
-                imgs.append(i)
-    else:
+    file_names = os.listdir(im_path)
+    if not file_names:  # if there are no files in the user input folder
         raise Exception("No files found inside input path")
-    for i in imgs:
-        shutil.copy(im_path + "/" + i, temp_dir)
+    for i in file_names:
+        file_name, file_extension = os.path.splitext(i)
+        if file_extension in IMAGE_EXTENSIONS:
+            shutil.copy(im_path + "/" + i, temp_dir)
 
 
 def transfer_imgs_from_list(im_list, temp_dir):
-    imgs = []
-    if im_list:
-        for i in im_list:
-            logger.info(f"i={i}")
-            img_name = os.path.basename(i)
-            dir_path = os.path.dirname(i)
-
-            file_name, file_extension = os.path.splitext(img_name)
-
-            if file_extension in {
-                ".exr",
-                ".png",
-                ".jpg",
-                ".jpeg",
-                ".EXR",
-                ".PNG",
-                ".JPG",
-                ".JPEG",
-            }:
-                imgs.append(i)
-    else:
+    if not im_list:
         raise Exception("No files found in list")
 
-    if imgs:
-        for i in imgs:
+    copied = False
+    for i in im_list:
+        logger.info(f"i={i}")
+        file_name, file_extension = os.path.splitext(os.path.basename(i))
+        if file_extension in IMAGE_EXTENSIONS:
             shutil.copy(i, temp_dir)
-    else:
+            copied = True
+
+    if not copied:
         raise Exception("No images found inside input path")
 
 
@@ -89,16 +68,7 @@ def transfer_single_img(img_path, temp_dir):
 
     file_name, file_extension = os.path.splitext(img_name)
 
-    if file_extension in {
-        ".exr",
-        ".png",
-        ".jpg",
-        ".jpeg",
-        ".EXR",
-        ".PNG",
-        ".JPG",
-        ".JPEG",
-    }:
+    if file_extension in IMAGE_EXTENSIONS:
         imgs.append(img_name)
 
     for i in imgs:
@@ -148,20 +118,39 @@ def get_folder_name(file_path):
         return None  # or you could return an empty string or another placeholder
 
 
+def _is_frame_placeholder(name: str) -> bool:
+    """Check if a file stem ends with ".####" or "_####"."""
+    return name.endswith("####") and name[-5:-4] in (".", "_")
+
+
+def _sequence_folder(path: str) -> Optional[str]:
+    """Return the folder part of a ".####"/"_####" sequence path, or None."""
+    # Most inputs are plain folders or files, which can be rejected right away
+    if "####" not in path:
+        return None
+    sep = max(path.rfind("/"), path.rfind("\\"))
+    if sep < 0:
+        return None
+    name = path[sep + 1 :]
+    if not _is_frame_placeholder(name):
+        # Allow a single extension after the frame placeholder
+        dot = name.rfind(".")
+        if dot < 0 or dot == len(name) - 1 or not _is_frame_placeholder(name[:dot]):
+            return None
+    return path[: sep + 1]
+
+
 def clean_input_dirs(input_dirs):
     """removes filenames leaving just the directory path"""
-    # Pattern to match filenames ending specifically with ".####" or "_####"
-    pattern = r"(.*[\\/])[^\\/]*[._]####(?:\.[^.]+)?$"
-
     # Iterate over each dictionary in the list
     for item in input_dirs:
         # Iterate over each key-value pair in the dictionary
         for key, path in item.items():
-            # Check if path matches the pattern and extract the folder path if it does
-            match = re.match(pattern, path)
-            if match:
+            # Check if path is a sequence and extract the folder path if it is
+            folder = _sequence_folder(path)
+            if folder is not None:
                 # Update the path in the dictionary to just the folder path
-                item[key] = match.group(1).rstrip("/")
+                item[key] = folder.rstrip("/")
 
 
 def get_first_frame(folder_path):
@@ -177,14 +166,11 @@ def get_first_frame(folder_path):
     if not os.path.isdir(folder_path):
         raise ValueError(f"The provided path '{folder_path}' is not a valid directory.")
 
-    # Regular expression to capture frame numbers in filenames
-    frame_pattern = re.compile(r"(\d+)(?=\.\w+$)")
-
     frame_numbers = []
 
     # Scan through the files in the folder
     for file_name in os.listdir(folder_path):
-        match = frame_pattern.search(file_name)
+        match = _FRAME_NUMBER_RE.search(file_name)
         if match:
             frame_numbers.append(int(match.group(0)))
 
@@ -212,15 +198,14 @@ def copy_matching_files(input_path, cache_dir):
     # Identify the base name (before the '#' placeholders)
     base_dir = os.path.dirname(input_path)
     base_name = os.path.basename(input_path).split("#")[0]
+    extension = os.path.splitext(input_path)[1]
 
     # Ensure the cache directory exists
     os.makedirs(cache_dir, exist_ok=True)
 
     # Iterate through files in the base directory and find matches
     for file_name in os.listdir(base_dir):
-        if file_name.startswith(base_name) and file_name.endswith(
-            os.path.splitext(input_path)[1]
-        ):
+        if file_name.startswith(base_name) and file_name.endswith(extension):
             src_path = os.path.join(base_dir, file_name)
             dest_path = os.path.join(cache_dir, file_name)
             shutil.copy(src_path, dest_path)
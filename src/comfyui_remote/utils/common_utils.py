@@ -1,19 +1,48 @@
 import logging
 import os
 import re
+import signal
 import subprocess
-from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Last run of digits in a file name
+_LAST_NUMBER_RE = re.compile(r"(\d+)(?!.*\d)")
+# Every run of digits in a file name
+_NUMBER_RE = re.compile(r"(\d+)")
+# Command line fragments identifying a local ComfyUI server process
+_COMFY_PROCESS_MARKERS = (b"python", b"cuda", b"gui.py")
+
 os.environ["OPENCV_IO_ENABLE_OPENEXR"] = "1"
 
 
 def kill_comfy_instances():
-    subprocess.run(
-        "ps ux | grep python | grep cuda | grep gui.py | awk '{print $2}' | xargs kill",
-        shell=True,
-    )
+    if not os.path.isdir("/proc"):
+        subprocess.run(
+            "ps ux | grep python | grep cuda | grep gui.py | awk '{print $2}' | xargs kill",
+            shell=True,
+        )
+        return
+
+    # Same match as the ps/grep pipeline above, read straight from /proc so no
+    # shell and five helper processes are spawned on every cleanup
+    uid = os.getuid()
+    with os.scandir("/proc") as it:
+        for entry in it:
+            if not entry.name.isdigit():
+                continue
+            try:
+                if entry.stat().st_uid != uid:
+                    continue
+                with open(os.path.join(entry.path, "cmdline"), "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                continue  # the process exited while scanning
+            if all(marker in cmdline for marker in _COMFY_PROCESS_MARKERS):
+                try:
+                    os.kill(int(entry.name), signal.SIGTERM)
+                except OSError:
+                    pass
 
 
 def create_sequential_folder(base_path):
@@ -74,9 +103,8 @@ def extract_paths(input_dict):
     paths = []
     for key, value in input_dict.items():
         if isinstance(value, str):
-            path = Path(value)
             # Check if the path is absolute or exists relative to the current directory
-            if path.is_absolute() or path.exists():
+            if os.path.isabs(value) or os.path.exists(value):
                 paths.append({key: value})
     return paths
 
@@ -95,7 +123,7 @@ def has_frame_range(folder_path):
     # Extract numeric parts from filenames
     numbers = []
     for file in files:
-        match = re.search(r"(\d+)(?!.*\d)", file)
+        match = _LAST_NUMBER_RE.search(file)
         if match:
             numbers.append(int(match.group(1)))
 
@@ -118,12 +146,9 @@ def has_frame_range(folder_path):
 def get_filenames_in_range(directory, start, end):
     matching_filenames = []
 
-    # Regular expression pattern to find a sequence of digits in the filename
-    pattern = re.compile(r"(\d+)")
-
     for filename in os.listdir(directory):
         # Find all sequences of digits in the filename
-        matches = pattern.findall(filename)
+        matches = _NUMBER_RE.findall(filename)
 
         if matches:
             # Convert all matches to integers and check if any match is within the range
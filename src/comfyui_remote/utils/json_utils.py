@@ -2,10 +2,50 @@ import json
 import logging
 import os
 import random
-from typing import Any, List
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Raw text of recently read JSON files, keyed by absolute path
+_JSON_TEXT_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], str]]" = OrderedDict()
+_JSON_TEXT_CACHE_SIZE = 32
+
+# Loader node classes that take a directory as input
+INPUT_DIR_NODE_CLASSES = frozenset(("VHS_LoadImagesPath", "dnLoadImagePath"))
+# Every loader node class
+INPUT_NODE_CLASSES = INPUT_DIR_NODE_CLASSES | {"LoadImage", "dnLoadImage"}
+# Output node classes that carry a start_frame input
+START_FRAME_NODE_CLASSES = frozenset(("dnFileOut", "dnSaveImage"))
+
+
+def _read_json_text(json_file: str) -> str:
+    """
+    Read a JSON file, reusing the cached text while the file is unchanged on disk.
+
+    Args:
+        json_file (str): The path to the JSON file.
+
+    Returns:
+        str: The contents of the file.
+    """
+    stat = os.stat(json_file)
+    path = os.path.abspath(json_file)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _JSON_TEXT_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        _JSON_TEXT_CACHE.move_to_end(path)
+        return cached[1]
+
+    with open(json_file, "r") as file:
+        text = file.read()
+    _JSON_TEXT_CACHE[path] = (stamp, text)
+    _JSON_TEXT_CACHE.move_to_end(path)
+    if len(_JSON_TEXT_CACHE) > _JSON_TEXT_CACHE_SIZE:
+        _JSON_TEXT_CACHE.popitem(last=False)
+    return text
+
 
 def load_json_data(json_file: str) -> dict:
     """
@@ -21,8 +61,7 @@ def load_json_data(json_file: str) -> dict:
         ValueError: If there is an error reading the JSON file.
     """
     try:
-        with open(json_file, "r") as file:
-            return json.load(file)
+        return json.loads(_read_json_text(json_file))
     except (FileNotFoundError, json.JSONDecodeError) as e:
         raise ValueError(f"Error reading JSON file: {e}")
 
@@ -102,21 +141,18 @@ def modify_syndata_input(
 
 
 def json_publish_script(json_data):
-    # Extract all class_type values from the JSON object
-    class_types = [item.get("class_type") for item in json_data.values()]
-
-    # Check if every class_type is either "dnString" or "dnPublisher"
-    if all(class_type in {"dnString", "dnPublisher"} for class_type in class_types):
-        return True
-    else:
-        return False
+    # Check if every class_type is either "dnString" or "dnPublisher",
+    # stopping at the first node that is not
+    return all(
+        item.get("class_type") in {"dnString", "dnPublisher"}
+        for item in json_data.values()
+    )
 
 
 def is_input_dir(json_data: dict) -> bool:
     # Track if input node takes a directory as input
     return any(
-        isinstance(value, dict)
-        and value.get("class_type") in {"VHS_LoadImagesPath", "dnLoadImagePath"}
+        isinstance(value, dict) and value.get("class_type") in INPUT_DIR_NODE_CLASSES
         for value in json_data.values()
     )
 
@@ -125,9 +161,15 @@ def has_input_node(json_data: dict) -> bool:
     # Track if json file has an input node
     """Check if JSON has an input node."""
     return any(
-        isinstance(value, dict)
-        and value.get("class_type")
-        in ["VHS_LoadImagesPath", "LoadImage", "dnLoadImage", "dnLoadImagePath"]
+        isinstance(value, dict) and value.get("class_type") in INPUT_NODE_CLASSES
+        for value in json_data.values()
+    )
+
+
+def has_publisher(json_data: dict) -> bool:
+    """Check if JSON has a dnPublisher node."""
+    return any(
+        isinstance(value, dict) and value.get("class_type") == "dnPublisher"
         for value in json_data.values()
     )
 
@@ -139,27 +181,53 @@ def search_params(json_data: dict, node_class: str) -> List[str]:
 
     returns: full name of node (title)"""
 
-    param_list = []
-    for key, value in json_data.items():
+    return search_params_by_class(json_data, (node_class,))[node_class]
+
+
+def search_params_by_class(
+    json_data: dict, node_classes: Iterable[str]
+) -> Dict[str, List[str]]:
+    """Search parameters of several node classes in a single pass.
+
+    takes as input: json data and an iterable of class_type: dnInteger, dnString dnFloat.
+
+    returns: dict of class_type to full names of nodes (titles)"""
+
+    params: Dict[str, List[str]] = {node_class: [] for node_class in node_classes}
+    for value in json_data.values():
         if isinstance(value, dict) and "class_type" in value:
-            if value["class_type"] == node_class:
-                class_type = value["_meta"]["title"]
-                param_list.append(class_type)
-    return param_list
+            param_list = params.get(value["class_type"])
+            if param_list is not None:
+                param_list.append(value["_meta"]["title"])
+    return params
 
 
-def update_values(json_data: dict, returned_args: dict) -> dict:
-    """Generalized update function for int, float, and str parameters.
+def build_title_index(json_data: dict) -> Dict[str, str]:
+    """Map each node title to its key in the workflow.
 
-    Takes as input: json data, new param values.
-    Automatically finds and updates the correct key in the inputs section."""
+    takes as input: json data
+
+    returns: dict of node title to node key"""
 
-    title_to_key = {
+    return {
         value["_meta"]["title"]: key
         for key, value in json_data.items()
         if "_meta" in value
     }
 
+
+def update_values(json_data: dict, returned_args: dict) -> dict:
+    """Generalized update function for int, float, and str parameters.
+
+    Takes as input: json data, new param values.
+    Automatically finds and updates the correct key in the inputs section."""
+
+    # Nothing to update, so skip building the title index
+    if not returned_args:
+        return json_data
+
+    title_to_key = build_title_index(json_data)
+
     for arg_key, arg_value in returned_args.items():
         key_to_update = title_to_key[arg_key]
 
@@ -266,16 +334,18 @@ def get_dnfileout_version(data):
     return None
 
 
-def display_json_param(json_data: dict, param: str) -> dict:
+def display_json_param(
+    json_data: dict, param: str, title_to_key: Optional[Dict[str, str]] = None
+) -> dict:
     """
     Takes as input: json data, new param values.
-    Automatically finds and returns the default key in the inputs section."""
+    Automatically finds and returns the default key in the inputs section.
 
-    title_to_key = {
-        value["_meta"]["title"]: key
-        for key, value in json_data.items()
-        if "_meta" in value
-    }
+    Callers looking up several params can pass an index from build_title_index
+    so the workflow is not rescanned for each one."""
+
+    if title_to_key is None:
+        title_to_key = build_title_index(json_data)
 
     key_to_update = title_to_key[param]
     logger.debug(f"key_to_update={key_to_update}")
@@ -359,13 +429,15 @@ def modify_json_controlnet_param(json_data: dict, controlnet: float) -> dict:
 
 
 def modify_start_frame(json_data, start_frame):
-    fileout_result = _modify_json_param(
-        json_data, "dnFileOut", "start_frame", start_frame
-    )
-    saveimage_result = _modify_json_param(
-        json_data, "dnSaveImage", "start_frame", start_frame
-    )
-    return fileout_result, saveimage_result
+    # Update both output node classes in a single pass over the workflow
+    for value in json_data.values():
+        if (
+            isinstance(value, dict)
+            and value.get("class_type") in START_FRAME_NODE_CLASSES
+            and isinstance(value.get("inputs"), dict)
+        ):
+            value["inputs"]["start_frame"] = start_frame
+    return json_data, json_data
 
 
 def modify_fileout_end_frame(json_data, end_frame):
@@ -1,27 +1,47 @@
 """"""
 
 import getpass
+import logging
 import platform
-import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 
 import requests
 
+logger = logging.getLogger(__name__)
+
 _PIPEQUERY_SERVER = "http://pipequery.zro.dneg.com/v1/graphql"
 
-_GRAPHQL_HEADERS = {
-    "Content-Type": "application/graphql",
-    "Accept": "application/json",
-    "Connection": "keep-alive",
-    "User-Agent": "dna-pq-test/0.0.0",
-    "x-client-app-name": "windows-asset_browser",
-    "x-client-app-version": "0.0.0",
-    "x-client-billing-code": "TESTFEAT",
-    "x-client-user": getpass.getuser(),
-    "x-client-site": requests.get("http://dnsite/sitedata/key/short_name").json()[
-        "short_name"
-    ],
-    "x-client-host": platform.node(),
-}
+# Headers sent with every query, built on first use
+_GRAPHQL_HEADERS: Optional[Dict[str, str]] = None
+
+
+def _get_graphql_headers() -> Dict[str, str]:
+    """Get the headers sent with every query.
+
+    The site lookup is an HTTP request, so it is done on first use instead of
+    at import time.
+
+    Returns:
+        dict: Request headers.
+    """
+    global _GRAPHQL_HEADERS
+    if _GRAPHQL_HEADERS is None:
+        _GRAPHQL_HEADERS = {
+            "Content-Type": "application/graphql",
+            "Accept": "application/json",
+            "Connection": "keep-alive",
+            "User-Agent": "dna-pq-test/0.0.0",
+            "x-client-app-name": "windows-asset_browser",
+            "x-client-app-version": "0.0.0",
+            "x-client-billing-code": "TESTFEAT",
+            "x-client-user": getpass.getuser(),
+            "x-client-site": requests.get(
+                "http://dnsite/sitedata/key/short_name"
+            ).json()["short_name"],
+            "x-client-host": platform.node(),
+        }
+    return _GRAPHQL_HEADERS
 
 
 def pipequery_send(queries, show=None):
@@ -31,35 +51,31 @@ def pipequery_send(queries, show=None):
         query (str): graphql query
         monitor (object): Monitor object.
     """
-    headers = _GRAPHQL_HEADERS
+    headers = _get_graphql_headers()
     if show:
+        # Copy so the billing code does not leak into later queries
+        headers = dict(headers)
         headers["x-client-billing-code"] = show
 
-    def make_request(id, url, headers, query, results):
+    def make_request(query):
         request = requests.post(
-            url, headers=headers, data=str.encode(query), timeout=None
+            _PIPEQUERY_SERVER, headers=headers, data=str.encode(query), timeout=None
         )
-        result = request.json()
-        data = result["data"]["latest_versions"]
-        results["data"]["latest_versions"].extend(data)
+        return request.json()["data"]["latest_versions"]
 
-    threads = []
     results = {"data": {"latest_versions": []}}
-    results.setdefault
-    for id, query in enumerate(queries):
-        threads.append(
-            threading.Thread(
-                target=make_request,
-                args=(id, _PIPEQUERY_SERVER, headers, query, results),
-            )
-        )
-    # Start each thread
-    for thread in threads:
-        thread.start()
-
-    # Wait for all threads to complete
-    for thread in threads:
-        thread.join()
+    if not queries:
+        return results
+
+    # One worker per query, as before; merging from the futures keeps the answers
+    # in query order and reports failed queries instead of dropping them silently
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        futures = [executor.submit(make_request, query) for query in queries]
+        for future in futures:
+            try:
+                results["data"]["latest_versions"].extend(future.result())
+            except Exception:
+                logger.exception("pipequery request failed")
 
     return results
 
@@ -77,7 +93,6 @@ def create_find_by_name_tags(show, scopes, kinds, name_tags, task=None):
     Returns:
         str: Query.
     """
-    queries = []
     collapsed_name_tags = "".join(
         '{{name:"{0}",value:"{1}"}}'.format(key, value) for key, value in name_tags
     )
@@ -87,35 +102,38 @@ def create_find_by_name_tags(show, scopes, kinds, name_tags, task=None):
     )
     task_segment = "" if not task else 'tasks:["{0}"]'.format(task)
 
-    for scope in scopes:
-        queries.append(
-            "{{latest_versions("
-            "mode:VERSION_NUMBER,"
-            'show:"{show}",'
-            'scope_names:"{scope}",'
-            "{task_segment},"
-            "{kind_segment}"
-            "name_tags:{{"
-            "match:EXACT,"
-            "tags:[{collapsed_name_tags}]"
-            "}}"
-            "){{"
-            "number{{major}},"
-            "name,"
-            "files{{name,path,type,ondisk_sites{{short_name}}}},"
-            "scope{{name}},"
-            "base_name,"
-            "id,"
-            "kind{{id}},"
-            "status"
-            "}}"
-            "}}".format(
-                scope=scope,
-                kind_segment=kind_segment,
-                task_segment=task_segment,
-                collapsed_name_tags=collapsed_name_tags,
-                show=show,
-            )
+    # Only the scope changes between queries, so format everything around it once
+    query_head = (
+        "{{latest_versions("
+        "mode:VERSION_NUMBER,"
+        'show:"{show}",'
+        'scope_names:"'.format(show=show)
+    )
+    query_tail = (
+        '",'
+        "{task_segment},"
+        "{kind_segment}"
+        "name_tags:{{"
+        "match:EXACT,"
+        "tags:[{collapsed_name_tags}]"
+        "}}"
+        "){{"
+        "number{{major}},"
+        "name,"
+        "files{{name,path,type,ondisk_sites{{short_name}}}},"
+        "scope{{name}},"
+        "base_name,"
+        "id,"
+        "kind{{id}},"
+        "status"
+        "}}"
+        "}}".format(
+            kind_segment=kind_segment,
+            task_segment=task_segment,
+            collapsed_name_tags=collapsed_name_tags,
         )
+    )
+
+    queries = [query_head + scope + query_tail for scope in scopes]
 
     return queries
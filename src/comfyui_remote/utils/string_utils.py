@@ -15,6 +15,7 @@ from pyparsing import (
     ZeroOrMore,
     Group,
     Dict,
+    ParserElement,
     White,
     pyparsing_common as ppc,
 )
@@ -22,6 +23,48 @@ from pyparsing import (
 logger = logging.getLogger(__name__)
 
 
+# Parser for convert_string_to_dict, built on first use and reused afterwards
+_GRAMMAR: "ParserElement | None" = None
+
+
+def _get_grammar() -> ParserElement:
+    """Get the pyparsing grammar used to parse dictionary strings.
+
+    Returns:
+        pyparsing.ParserElement: The cached grammar.
+    """
+    global _GRAMMAR
+    if _GRAMMAR is not None:
+        return _GRAMMAR
+
+    left_brace = Literal("{").suppress() | Literal("[").suppress()
+    right_brace = Literal("}").suppress() | Literal("]").suppress()
+
+    quoted_string = QuotedString('"', escChar="\\", unquoteResults=True) | QuotedString(
+        "'", escChar="\\", unquoteResults=True
+    )
+    bare_identifier = Word(alphas + "_", alphanums + "_")
+
+    string_value = quoted_string | bare_identifier
+    numeric_value = ppc.number()
+    null_value = Literal("None") | Literal("null") | Literal("NULL")
+    null_value.setParseAction(lambda: [""])
+
+    value = null_value | numeric_value | string_value
+    key = string_value
+
+    colon_or_equals = (Literal(":") | Literal("=")).suppress()
+    whitespace = White(min=1).leaveWhitespace().suppress()
+    delimiter = colon_or_equals | whitespace
+
+    key_value_pair = Group(key + delimiter + value)
+    pair_separator = (Literal(",") | Literal(";")).suppress()
+    pairs = key_value_pair + ZeroOrMore(pair_separator + key_value_pair)
+
+    _GRAMMAR = Optional(left_brace) + Optional(Dict(pairs)) + Optional(right_brace)
+    return _GRAMMAR
+
+
 def convert_string_to_dict(input_string):
     """Convert a string representation of a dictionary into a Python dict.
 
@@ -55,34 +98,8 @@ def convert_string_to_dict(input_string):
     if not input_string or not isinstance(input_string, str):
         return {}
 
-    left_brace = Literal("{").suppress() | Literal("[").suppress()
-    right_brace = Literal("}").suppress() | Literal("]").suppress()
-
-    quoted_string = QuotedString('"', escChar="\\", unquoteResults=True) | QuotedString(
-        "'", escChar="\\", unquoteResults=True
-    )
-    bare_identifier = Word(alphas + "_", alphanums + "_")
-
-    string_value = quoted_string | bare_identifier
-    numeric_value = ppc.number()
-    null_value = Literal("None") | Literal("null") | Literal("NULL")
-    null_value.setParseAction(lambda: [""])
-
-    value = null_value | numeric_value | string_value
-    key = string_value
-
-    colon_or_equals = (Literal(":") | Literal("=")).suppress()
-    whitespace = White(min=1).leaveWhitespace().suppress()
-    delimiter = colon_or_equals | whitespace
-
-    key_value_pair = Group(key + delimiter + value)
-    pair_separator = (Literal(",") | Literal(";")).suppress()
-    pairs = key_value_pair + ZeroOrMore(pair_separator + key_value_pair)
-
-    grammar = Optional(left_brace) + Optional(Dict(pairs)) + Optional(right_brace)
-
     try:
-        result = grammar.parseString(input_string, parseAll=True).asDict()
+        result = _get_grammar().parseString(input_string, parseAll=True).asDict()
         return result
     except ParseException as parse_error:
         logger.warning('Failed to parse string to dictionary: "%s"', input_string)